@@ -0,0 +1,30 @@
+# Author: Sourav Kumar Parida, Rishi Dharmeshbhai Patel
+# Date: 10/15/2026
+# Description: This module holds the configuration values shared by every Cobra Wars module, so they are declared once
+# and cannot drift apart between files.
+
+# Configuration Values
+DISPLAY_WIDTH, DISPLAY_HEIGHT = 1200, 900  # Screen dimensions in pixels
+FRAME_RATE = 30                            # FPS
+REPTILE_DIMENSION = 20                     # Grid cell size
+GRID_W, GRID_H = DISPLAY_WIDTH // REPTILE_DIMENSION, DISPLAY_HEIGHT // REPTILE_DIMENSION  # Grid size in cells
+ACTION_WIDTH, ACTION_HEIGHT = 100, 50      # Action button dimensions
+ORB_RADIUS = 10                            # Radius of the vitality orb
+ORB_RESPAWN_TIME = 20                      # Time for orb to respawn, in seconds
+IDLE_WAIT = 500                            # Longest sleep waiting for input while no battle is running, in milliseconds
+
+# Motion Directions
+MOVE_RIGHT = (1, 0)
+MOVE_LEFT = (-1, 0)
+MOVE_UP = (0, -1)
+MOVE_DOWN = (0, 1)
+
+# Palette
+COLOR_BLACK = (0, 0, 0)
+COLOR_WHITE = (255, 255, 255)
+COLOR_GRAY = (100, 100, 100)
+COLOR_PINK = (255, 192, 203)
+COLOR_YELLOW = (255, 223, 0)
+COLOR_ORANGE = (255, 69, 0)
+COLOR_GREEN = (173, 255, 47)
+COLOR_GOLD = (255, 215, 0)
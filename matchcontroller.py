@@ -7,34 +7,9 @@ import pygame
 import sys
 from pygame.locals import *
 from random import randint
-import time
 from reptile import Reptile
 from vitalityorb import VitalityOrb
-
-# Configuration Values
-DISPLAY_WIDTH, DISPLAY_HEIGHT = 1200, 900
-FRAME_RATE = 30
-REPTILE_DIMENSION = 20
-ACTION_WIDTH, ACTION_HEIGHT = 100, 50
-ORB_RADIUS = 10
-ORB_RESPAWN_TIME = 20  # in seconds
-
-# Motion Directions
-MOVE_RIGHT = {'x': 1, 'y': 0}
-MOVE_LEFT = {'x': -1, 'y': 0}
-MOVE_UP = {'x': 0, 'y': -1}
-MOVE_DOWN = {'x': 0, 'y': 1}
-
-# Palette
-COLOR_BLACK = (0, 0, 0)
-COLOR_WHITE = (255, 255, 255)
-COLOR_GRAY = (100, 100, 100)
-COLOR_PINK = (255, 192, 203)
-COLOR_YELLOW = (255, 223, 0)
-COLOR_ORANGE = (255, 69, 0)
-COLOR_GREEN = (173, 255, 47)
-COLOR_GOLD = (255, 215, 0)
-
+from config import *
 
 
 class MatchController:
@@ -51,17 +26,32 @@ class MatchController:
            scoresReady (bool): True if the scores have been calculated and are ready to be displayed.
            combatant1 (Reptile): First reptile controlled by the player or AI.
            combatant2 (Reptile): Second reptile controlled by another player or AI.
-           restorativeOrbs (list): List of vitality orbs that appear in the game to restore vitality.
-           lastOrbRegen (float): Timestamp for the last regeneration of a vitality orb.
-           nourishment (dict): Current position of the nourishment item in the game.
+           restorativeOrbs (dict): Vitality orbs that appear in the game to restore vitality, keyed by their (x, y) coordinates.
+           nextOrbRegen (int): Time, in pygame ticks (milliseconds), at which the next vitality orb is due.
+           nourishment (tuple): Current (x, y) position of the nourishment item in the game.
            controls (dict): A dictionary to store references to on-screen buttons.
            creatureGraphic (pygame.Surface): Graphical representation of the nourishment in the game.
            logoGraphic (pygame.Surface): Game logo graphic.
+           battleOverGraphic (pygame.Surface): Graphic shown on the battle over screen.
            totalRounds (int): Total number of rounds in a game session.
            currentBattle (int): The current battle round number.
            isAcceptingInput (bool): True when the game is ready to accept input from the user.
            enteredText (str): Text currently entered by the user in input mode.
            battleScores (dict): Dictionary holding the scores of each combatant across rounds.
+           font_24 (pygame.font.Font): Font used for button labels.
+           font_36 (pygame.font.Font): Font used for scores, battle information and prompts.
+           textCache (dict): Rendered surfaces of fixed labels keyed by font, text and colors.
+           hudTextCache (dict): The value and rendered surface last shown by each changing heads-up display text, keyed by slot.
+           vitalityMeterCache (dict): Rendered vitality meter surfaces keyed by (vitality, max vitality).
+           interactionHandlers (dict): Event handler methods keyed by pygame event type.
+           combatant1Keys (dict): Steering keys of combatant 1 mapped to (new direction, forbidden direction).
+           combatant2Keys (dict): Steering keys of combatant 2 mapped to (new direction, forbidden direction).
+           combatant1Steering (tuple): Last (new direction, forbidden direction) requested for combatant 1 this frame, if any.
+           combatant2Steering (tuple): Last (new direction, forbidden direction) requested for combatant 2 this frame, if any.
+           dirtyCells (set): Grid cells, as (x, y) tuples, whose content changed since the last frame.
+           hudState (dict): What each heads-up display element showed last frame, and where, keyed by element name.
+           shownScene (str): The scene drawn last frame; a different scene triggers a full repaint.
+           needsRedraw (bool): True when an interaction may have changed a menu, input or battle over screen.
 
        Methods:
            generate_nourishment(): Generates a new nourishment item on the game field.
@@ -74,26 +64,66 @@ class MatchController:
         self.canvas = pygame.display.set_mode((DISPLAY_WIDTH, DISPLAY_HEIGHT))
         pygame.display.set_caption("Cobra Wars")
         self.timer = pygame.time.Clock()
+        # Only letting the events the game reads reach the event queue
+        # (TEXTINPUT stays allowed since pygame fills KEYDOWN's unicode from it, and WINDOWEXPOSED
+        # since screens are only repainted when something changes)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.TEXTINPUT,
+                                  pygame.WINDOWEXPOSED])
         self.isActive = True
         self.isInPlay = False
         self.isPaused = False
         self.isOver = False
         self.scoresReady = False  
-        self.combatant1 = Reptile({'x': 5, 'y': DISPLAY_HEIGHT // REPTILE_DIMENSION // 2}, MOVE_RIGHT, COLOR_YELLOW)
-        self.combatant2 = Reptile({'x': DISPLAY_WIDTH // REPTILE_DIMENSION - 5, 'y': DISPLAY_HEIGHT // REPTILE_DIMENSION // 2}, MOVE_LEFT, COLOR_ORANGE)
-        self.restorativeOrbs = []
-        self.lastOrbRegen = time.time()
+        self.combatant1 = Reptile((5, GRID_H // 2), MOVE_RIGHT, COLOR_YELLOW)
+        self.combatant2 = Reptile((GRID_W - 5, GRID_H // 2), MOVE_LEFT, COLOR_ORANGE)
+        self.restorativeOrbs = {}
+        self.nextOrbRegen = pygame.time.get_ticks() + ORB_RESPAWN_TIME * 1000
         self.nourishment = self.generate_nourishment()
         self.controls = {}
-        self.creatureGraphic = pygame.image.load('rat_image.jpg')
-        self.creatureGraphic = pygame.transform.scale(self.creatureGraphic, (REPTILE_DIMENSION, REPTILE_DIMENSION))
-        self.logoGraphic = pygame.image.load('cobra_wars_image.png')
-        self.logoGraphic = pygame.transform.scale(self.logoGraphic, (600, 150))
+        # Converting images to the display's pixel format once, so blitting them needs no per-pixel conversion
+        self.creatureGraphic = pygame.transform.scale(pygame.image.load('rat_image.jpg').convert(),
+                                                      (REPTILE_DIMENSION, REPTILE_DIMENSION))
+        self.logoGraphic = pygame.transform.scale(pygame.image.load('cobra_wars_image.png').convert_alpha(), (600, 150))
+        self.battleOverGraphic = pygame.image.load('game_over_image.png').convert_alpha()
         self.totalRounds = 0
         self.currentBattle = 1
         self.isAcceptingInput = False
         self.enteredText = ''
         self.battleScores = {"Combatant 1": [], "Combatant 2": []}
+        # Fonts are built once and reused; fixed labels are cached by their content and
+        # changing texts keep only their latest surface
+        self.font_24 = pygame.font.Font(None, 24)
+        self.font_36 = pygame.font.Font(None, 36)
+        self.textCache = {}
+        self.hudTextCache = {}
+        self.vitalityMeterCache = {}
+        # Event handlers keyed by event type, and steering keys mapped to (new direction, forbidden direction)
+        self.interactionHandlers = {
+            pygame.QUIT: self.handle_quit,
+            pygame.MOUSEBUTTONDOWN: self.handle_mouse_click,
+            pygame.KEYDOWN: self.handle_key_press,
+            pygame.WINDOWEXPOSED: self.handle_window_exposed,
+        }
+        self.combatant1Keys = {
+            pygame.K_w: (MOVE_UP, MOVE_DOWN),
+            pygame.K_a: (MOVE_LEFT, MOVE_RIGHT),
+            pygame.K_s: (MOVE_DOWN, MOVE_UP),
+            pygame.K_d: (MOVE_RIGHT, MOVE_LEFT),
+        }
+        self.combatant2Keys = {
+            pygame.K_UP: (MOVE_UP, MOVE_DOWN),
+            pygame.K_LEFT: (MOVE_LEFT, MOVE_RIGHT),
+            pygame.K_DOWN: (MOVE_DOWN, MOVE_UP),
+            pygame.K_RIGHT: (MOVE_RIGHT, MOVE_LEFT),
+        }
+        self.combatant1Steering = None
+        self.combatant2Steering = None
+        # During play only the changed cells and heads-up display elements are repainted
+        self.dirtyCells = set()
+        self.hudState = {}
+        self.shownScene = None
+        self.needsRedraw = True
 
 
     def generate_nourishment(self):
@@ -101,12 +131,9 @@ class MatchController:
             Generates a new position for the nourishment item randomly on the game field.
 
             Returns:
-                dict: A dictionary containing 'x' and 'y' keys with values set to random positions within the game boundaries.
+                tuple: An (x, y) position chosen at random within the game boundaries.
         """
-        return {
-            'x': randint(0, DISPLAY_WIDTH // REPTILE_DIMENSION - 1),
-            'y': randint(0, DISPLAY_HEIGHT // REPTILE_DIMENSION - 1),
-        }
+        return randint(0, GRID_W - 1), randint(0, GRID_H - 1)
 
     def render_reptile(self, reptile):
         """
@@ -115,44 +142,99 @@ class MatchController:
             Args:
                 reptile (Reptile): The reptile object to be rendered, which includes its body segments and color.
         """
-        for segment in reptile.segments:
-            x_coord = segment['x'] * REPTILE_DIMENSION
-            y_coord = segment['y'] * REPTILE_DIMENSION
-            pygame.draw.rect(self.canvas, reptile.tint, pygame.Rect(x_coord, y_coord, REPTILE_DIMENSION, REPTILE_DIMENSION))
+        # Submitting every segment to pygame in one blits() call
+        self.canvas.blits([(reptile.tile, (x * REPTILE_DIMENSION, y * REPTILE_DIMENSION))
+                           for x, y in reptile.segments], False)
 
-    def render_vitality_meter(self, xPos, yPos, vitality, max_vitality):
+    def vitality_meter_surface(self, vitality, max_vitality):
         """
-            Draws a vitality meter on the canvas.
+            Returns a vitality meter surface for the given vitality.
 
             Description:
-                This method draws a horizontal bar that represents the reptile's current vitality
-                as a fraction of its maximum vitality. It is colored green to indicate vitality left
-                and bordered in gold.
-        """
-        if vitality > 0:
+                The meter is a horizontal bar that represents the reptile's current vitality as a fraction
+                of its maximum vitality. It is colored green to indicate vitality left and bordered in gold.
+                Each distinct meter is drawn once and reused afterwards; vitality never exceeds max_vitality,
+                so the cache stays bounded.
+
+            Returns:
+                pygame.Surface: The meter surface, or None when there is no vitality left to show.
+        """
+        if vitality <= 0:
+            return None
+        meter_key = (vitality, max_vitality)
+        meter_surface = self.vitalityMeterCache.get(meter_key)
+        if meter_surface is None:
+            meter_surface = pygame.Surface((100, 10), pygame.SRCALPHA)
             filled_width = (vitality / max_vitality) * 100
-            filled_rect = pygame.Rect(xPos, yPos, filled_width, 10)
-            pygame.draw.rect(self.canvas, COLOR_GREEN, filled_rect)
-            pygame.draw.rect(self.canvas, COLOR_GOLD, (xPos, yPos, 100, 10), 2)
+            pygame.draw.rect(meter_surface, COLOR_GREEN, pygame.Rect(0, 0, filled_width, 10))
+            pygame.draw.rect(meter_surface, COLOR_GOLD, (0, 0, 100, 10), 2)
+            self.vitalityMeterCache[meter_key] = meter_surface
+        return meter_surface
+
+    def render_text(self, font, text, tint, background=None):
+        """
+            Returns a rendered text surface for a fixed label, reusing a previously rendered one when the same text was drawn before.
+            Only use it for texts drawn from a small fixed set, since cached surfaces are never evicted.
+
+            Args:
+                font (pygame.font.Font): The font used to render the text.
+                text (str): The text to render.
+                tint (tuple): RGB color tuple for the text.
+                background (tuple): Optional RGB color tuple for the text background.
+
+            Returns:
+                pygame.Surface: The rendered text surface.
+        """
+        key = (font, text, tint, background)
+        text_surface = self.textCache.get(key)
+        if text_surface is None:
+            text_surface = font.render(text, True, tint, background)
+            self.textCache[key] = text_surface
+        return text_surface
+
+    def render_hud_text(self, slot, value, template, tint):
+        """
+            Returns the rendered text of a changing heads-up display slot, re-rendering it only when its value changed.
+
+            Args:
+                slot (str): The name of the heads-up display slot, e.g. 'tally1'.
+                value (int): The value shown in the slot.
+                template (str): Format string the value is inserted into.
+                tint (tuple): RGB color tuple for the text.
+
+            Returns:
+                pygame.Surface: The rendered text surface.
+        """
+        shown = self.hudTextCache.get(slot)
+        if shown is None or shown[0] != value:
+            shown = (value, self.font_36.render(template.format(value), True, tint))
+            self.hudTextCache[slot] = shown
+        return shown[1]
 
     def replenish_vitality_orbs(self):
         """
            Checks if enough time has passed to regenerate a vitality orb and, if so, regenerates one.
 
            Description:
-               This method appends a new VitalityOrb to the restorativeOrbs list and resets the
-               lastOrbRegen timer if the current time is sufficiently greater than the last orb
-               regeneration time based on ORB_RESPAWN_TIME.
+               This method adds a new VitalityOrb to the restorativeOrbs mapping once the pygame tick count
+               reaches nextOrbRegen, and schedules the next orb ORB_RESPAWN_TIME seconds later. An orb that
+               lands on a cell already holding one is dropped, so the existing orb is never replaced.
         """
-        currentTime = time.time()
-        if currentTime - self.lastOrbRegen >= ORB_RESPAWN_TIME:
-            self.restorativeOrbs.append(VitalityOrb())
-            self.lastOrbRegen = currentTime
+        currentTime = pygame.time.get_ticks()
+        if currentTime >= self.nextOrbRegen:
+            orb = VitalityOrb()
+            if orb.coordinates not in self.restorativeOrbs:
+                self.restorativeOrbs[orb.coordinates] = orb
+                self.mark_dirty(orb.coordinates)
+            self.nextOrbRegen = currentTime + ORB_RESPAWN_TIME * 1000
 
-    def manage_interactions(self):
+    def manage_interactions(self, waitTime=0):
         """
             Processes all player interactions and system events, managing game state transitions, input handling, and player controls.
 
+            Args:
+                waitTime (int): Milliseconds to sleep waiting for an event when none is queued; 0 returns immediately.
+
             Mouse Interactions:
             - Activates or deactivates text input mode when specific buttons are clicked.
             - Handles game state transitions such as starting, pausing, or restarting the game based on button interactions.
@@ -161,65 +243,109 @@ class MatchController:
             Keyboard Interactions:
             - Manages text input for settings like the number of rounds.
             - Controls in-game movements of combatants based on keyboard arrow or WASD keys without allowing reverse direction movement to prevent self-collision.
-        """
-        for interaction in pygame.event.get():
-            if interaction.type == pygame.QUIT:
+              Only the last steering key pressed for each combatant since the previous frame is applied.
+        """
+        self.combatant1Steering = None
+        self.combatant2Steering = None
+        interactions = pygame.event.get()
+        if not interactions and waitTime:
+            interaction = pygame.event.wait(waitTime)
+            if interaction.type != pygame.NOEVENT:
+                interactions = [interaction]
+        for interaction in interactions:
+            handler = self.interactionHandlers.get(interaction.type)
+            if handler:
+                handler(interaction)
+                self.needsRedraw = True
+
+        # Applying the final steering of each combatant once per frame
+        if self.combatant1Steering and self.combatant1.move_direction != self.combatant1Steering[1]:
+            self.combatant1.move_direction = self.combatant1Steering[0]
+        if self.combatant2Steering and self.combatant2.move_direction != self.combatant2Steering[1]:
+            self.combatant2.move_direction = self.combatant2Steering[0]
+
+    def handle_quit(self, interaction):
+        """
+            Stops the game loop when the window is closed.
+        """
+        self.isActive = False
+
+    def handle_window_exposed(self, interaction):
+        """
+            Forces a full repaint when the window is uncovered or restored, since otherwise only changes are redrawn.
+        """
+        self.shownScene = None
+
+    def handle_mouse_click(self, interaction):
+        """
+            Handles mouse clicks on the on-screen buttons, managing game state transitions such as
+            confirming the number of battles, starting, restarting or quitting the game.
+        """
+        if self.isAcceptingInput:
+            if self.controls.get('confirm') and self.controls['confirm'].collidepoint(interaction.pos):
+                print("Confirm button clicked")
+                try:
+                    self.totalRounds = int(self.enteredText)
+                    print(f"Total battles set to: {self.totalRounds}")
+                    self.enteredText = ''  # Clear the input field
+                    self.isAcceptingInput = False
+                    self.isInPlay = True  # Start the battle
+                    print("Battle set to start")
+                except ValueError:
+                    self.enteredText = ''
+                    print("Invalid input for battles")
+        elif self.controls.get('initiate') and self.controls['initiate'].collidepoint(interaction.pos):
+            self.isAcceptingInput = True
+            self.isInPlay = False
+
+        elif self.isOver:
+            if self.controls.get('replay') and self.controls['replay'].collidepoint(interaction.pos):
+                self.restart_battle()
+            elif self.controls.get('end') and self.controls['end'].collidepoint(interaction.pos):
                 self.isActive = False
-            elif interaction.type == pygame.MOUSEBUTTONDOWN:
-                if self.isAcceptingInput:
-                    if self.controls.get('confirm') and self.controls['confirm'].collidepoint(interaction.pos):
-                        print("Confirm button clicked")
-                        try:
-                            self.totalRounds = int(self.enteredText)
-                            print(f"Total battles set to: {self.totalRounds}")
-                            self.enteredText = ''  # Clear the input field
-                            self.isAcceptingInput = False
-                            self.isInPlay = True  # Start the battle
-                            print("Battle set to start")
-                        except ValueError:
-                            self.enteredText = ''
-                            print("Invalid input for battles")
-                elif self.controls.get('initiate') and self.controls['initiate'].collidepoint(interaction.pos):
+        else:
+            if not self.isInPlay and not self.isAcceptingInput:
+                if self.controls.get('initiate') and self.controls['initiate'].collidepoint(interaction.pos):
                     self.isAcceptingInput = True
-                    self.isInPlay = False
-
-                elif self.isOver:
-                    if self.controls.get('replay') and self.controls['replay'].collidepoint(interaction.pos):
-                        self.restart_battle()
-                    elif self.controls.get('end') and self.controls['end'].collidepoint(interaction.pos):
-                        self.isActive = False
-                else:
-                    if not self.isInPlay and not self.isAcceptingInput:
-                        if self.controls.get('initiate') and self.controls['initiate'].collidepoint(interaction.pos):
-                            self.isAcceptingInput = True
-                        elif self.controls.get('end') and self.controls['end'].collidepoint(interaction.pos):
-                            self.isActive = False
-
-            elif interaction.type == pygame.KEYDOWN:
-                if self.isAcceptingInput:
-                    if interaction.key == pygame.K_BACKSPACE:
-                        self.enteredText = self.enteredText[:-1]
-                    elif interaction.unicode.isdigit():
-                        self.enteredText += interaction.unicode
-                elif self.isInPlay and not self.isPaused:
-                    # Combatant 1 Controls
-                    if interaction.key == pygame.K_w and self.combatant1.move_direction != MOVE_DOWN:
-                        self.combatant1.move_direction = MOVE_UP
-                    elif interaction.key == pygame.K_a and self.combatant1.move_direction != MOVE_RIGHT:
-                        self.combatant1.move_direction = MOVE_LEFT
-                    elif interaction.key == pygame.K_s and self.combatant1.move_direction != MOVE_UP:
-                        self.combatant1.move_direction = MOVE_DOWN
-                    elif interaction.key == pygame.K_d and self.combatant1.move_direction != MOVE_LEFT:
-                        self.combatant1.move_direction = MOVE_RIGHT
-                    # Combatant 2 Controls
-                    if interaction.key == pygame.K_UP and self.combatant2.move_direction != MOVE_DOWN:
-                        self.combatant2.move_direction = MOVE_UP
-                    elif interaction.key == pygame.K_LEFT and self.combatant2.move_direction != MOVE_RIGHT:
-                        self.combatant2.move_direction = MOVE_LEFT
-                    elif interaction.key == pygame.K_DOWN and self.combatant2.move_direction != MOVE_UP:
-                        self.combatant2.move_direction = MOVE_DOWN
-                    elif interaction.key == pygame.K_RIGHT and self.combatant2.move_direction != MOVE_LEFT:
-                        self.combatant2.move_direction = MOVE_RIGHT
+                elif self.controls.get('end') and self.controls['end'].collidepoint(interaction.pos):
+                    self.isActive = False
+
+    def handle_key_press(self, interaction):
+        """
+            Handles key presses, either editing the number of battles being entered or recording the steering
+            requested for the combatants, which manage_interactions applies once all events are handled.
+        """
+        if self.isAcceptingInput:
+            if interaction.key == pygame.K_BACKSPACE:
+                self.enteredText = self.enteredText[:-1]
+            elif interaction.unicode.isdigit():
+                self.enteredText += interaction.unicode
+        elif self.isInPlay and not self.isPaused:
+            # Combatant 1 Controls
+            steering = self.combatant1Keys.get(interaction.key)
+            if steering:
+                self.combatant1Steering = steering
+            # Combatant 2 Controls
+            steering = self.combatant2Keys.get(interaction.key)
+            if steering:
+                self.combatant2Steering = steering
+
+    def boundary_damage(self, head):
+        """
+            Calculates the vitality lost by a combatant whose head touches the edges of the battle area.
+
+            Description:
+                Reptiles wrap around the battle area, so the head can never leave the grid. Instead, every
+                border cell the head sits on (left, right, top or bottom) costs 5 vitality; a corner counts twice.
+
+            Args:
+                head (tuple): The (x, y) position of the combatant's head.
+
+            Returns:
+                int: The vitality to deduct.
+        """
+        head_x, head_y = head
+        return 5 * ((head_x == 0) + (head_x == GRID_W - 1) + (head_y == 0) + (head_y == GRID_H - 1))
 
     def advance_game(self):
         """
@@ -232,62 +358,60 @@ class MatchController:
            - Checking for collisions between combatants and handling self-collisions, which deduct vitality.
            - Archiving scores and managing the transitions between battles or concluding the game if the conditions for the end are met.
         """
+        # Binding the objects used throughout the step to locals once
+        combatant1 = self.combatant1
+        combatant2 = self.combatant2
+        dirty_cells = self.dirtyCells
+
         self.replenish_vitality_orbs()
-        self.combatant1.move()
-        self.combatant2.move()
+        dirty_cells.update(combatant1.move())
+        dirty_cells.update(combatant2.move())
+        head1 = combatant1.segments[0]
+        head2 = combatant2.segments[0]
 
         # Checking for collisions with edges and reduce vitality if hit
-        if self.combatant1.segments[0]['x'] <= 0:
-            self.combatant1.vitality -= 5
-        elif self.combatant1.segments[0]['x'] >= DISPLAY_WIDTH // REPTILE_DIMENSION:
-            self.combatant1.vitality -= 5
-        if self.combatant1.segments[0]['y'] <= 0:
-            self.combatant1.vitality -= 5
-        elif self.combatant1.segments[0]['y'] >= DISPLAY_HEIGHT // REPTILE_DIMENSION:
-            self.combatant1.vitality -= 5
-
-        if self.combatant2.segments[0]['x'] <= 0:
-            self.combatant2.vitality -= 5
-        elif self.combatant2.segments[0]['x'] >= DISPLAY_WIDTH // REPTILE_DIMENSION:
-            self.combatant2.vitality -= 5
-        if self.combatant2.segments[0]['y'] <= 0:
-            self.combatant2.vitality -= 5
-        elif self.combatant2.segments[0]['y'] >= DISPLAY_HEIGHT // REPTILE_DIMENSION:
-            self.combatant2.vitality -= 5
+        combatant1.vitality -= self.boundary_damage(head1)
+        combatant2.vitality -= self.boundary_damage(head2)
 
         # Terminating the battle if any combatant's vitality reaches zero
-        if self.combatant1.vitality <= 0 or self.combatant2.vitality <= 0:
+        if combatant1.vitality <= 0 or combatant2.vitality <= 0:
             self.archive_scores()
             if self.currentBattle < self.totalRounds:
                 self.currentBattle += 1
                 self.initialize_next_battle()
             else:
                 self.isOver = True
+            # The combatants were replaced or the game ended, so nothing else happens this step
+            return
 
         # Managing interaction with vitality orbs
-        for orb in self.restorativeOrbs[:]:
-            if self.combatant1.detect_collision(orb.coordinates):
-                self.restorativeOrbs.remove(orb)
-                self.combatant1.vitality = min(self.combatant1.vitality + 30, 100)
-            elif self.combatant2.detect_collision(orb.coordinates):
-                self.restorativeOrbs.remove(orb)
-                self.combatant2.vitality = min(self.combatant2.vitality + 30, 100)
+        restorative_orbs = self.restorativeOrbs
+        if restorative_orbs.pop(head1, None):
+            dirty_cells.add(head1)
+            combatant1.vitality = min(combatant1.vitality + 30, 100)
+        if restorative_orbs.pop(head2, None):
+            dirty_cells.add(head2)
+            combatant2.vitality = min(combatant2.vitality + 30, 100)
 
         # Checking for collisions between combatants
-        if self.combatant1.segments[0] in self.combatant2.segments:
-            self.combatant1.vitality -= 5
-        if self.combatant2.segments[0] in self.combatant1.segments:
-            self.combatant2.vitality -= 5
+        if combatant2.occupies(head1):
+            combatant1.vitality -= 5
+        if combatant1.occupies(head2):
+            combatant2.vitality -= 5
 
-        if self.combatant1.detect_collision(self.nourishment):
+        if head1 == self.nourishment:
+            dirty_cells.add(self.nourishment)
             self.nourishment = self.generate_nourishment()
-            self.combatant1.tally += 5
-            self.combatant1.expand()
+            dirty_cells.add(self.nourishment)
+            combatant1.tally += 5
+            combatant1.expand()
 
-        if self.combatant2.detect_collision(self.nourishment):
+        if head2 == self.nourishment:
+            dirty_cells.add(self.nourishment)
             self.nourishment = self.generate_nourishment()
-            self.combatant2.tally += 5
-            self.combatant2.expand()
+            dirty_cells.add(self.nourishment)
+            combatant2.tally += 5
+            combatant2.expand()
 
     def initialize_next_battle(self):
         """
@@ -296,31 +420,150 @@ class MatchController:
             Key operations include:
             - Re-setting each combatant's position and vitality to the start conditions.
             - Regenerating the nourishment position on the game field.
-            - Clearing the list of restorative orbs and resetting the last orb regeneration timestamp.
+            - Removing all restorative orbs and rescheduling the next orb regeneration.
 
         """
 
         # Reseting combatant positions and vitality
-        self.combatant1 = Reptile({'x': 5, 'y': DISPLAY_HEIGHT // REPTILE_DIMENSION // 2}, MOVE_RIGHT, COLOR_YELLOW)
+        self.combatant1 = Reptile((5, GRID_H // 2), MOVE_RIGHT, COLOR_YELLOW)
         self.combatant1.vitality = 100
-        self.combatant2 = Reptile({'x': DISPLAY_WIDTH // REPTILE_DIMENSION - 5, 'y': DISPLAY_HEIGHT // REPTILE_DIMENSION // 2}, MOVE_LEFT,
+        self.combatant2 = Reptile((GRID_W - 5, GRID_H // 2), MOVE_LEFT,
                              COLOR_ORANGE)
         self.combatant2.vitality = 100
         # Reseting nourishment and vitality orbs
         self.nourishment = self.generate_nourishment()
         self.restorativeOrbs.clear()
-        self.lastOrbRegen = time.time()
+        self.nextOrbRegen = pygame.time.get_ticks() + ORB_RESPAWN_TIME * 1000
+        # Everything moved, so the next frame is painted in full
+        self.shownScene = None
+
+    def mark_dirty(self, position):
+        """
+            Marks the grid cell at the given position to be repainted on the next frame.
+
+            Args:
+                position (tuple): An (x, y) grid position.
+        """
+        self.dirtyCells.add(position)
+
+    def render_cell(self, cell):
+        """
+            Draws whatever currently lies on a grid cell, in the same order a full repaint would draw it.
+
+            Args:
+                cell (tuple): The (x, y) grid cell to draw.
+        """
+        x_coord = cell[0] * REPTILE_DIMENSION
+        y_coord = cell[1] * REPTILE_DIMENSION
+        for reptile in (self.combatant1, self.combatant2):
+            if reptile.occupies(cell):
+                self.canvas.blit(reptile.tile, (x_coord, y_coord))
+        orb = self.restorativeOrbs.get(cell)
+        if orb:
+            orb.render(self.canvas)
+        if self.nourishment == cell:
+            self.canvas.blit(self.creatureGraphic, (x_coord, y_coord))
+
+    def render_hud(self, hud_state, area=None):
+        """
+            Draws the heads-up display elements over the battle area: vitality meters, scores and battle information.
+
+            Args:
+                hud_state (dict): The layout returned by hud_layout().
+                area (pygame.Rect): When given, only the elements overlapping this area are drawn.
+        """
+        for value, rect, surface in hud_state.values():
+            if surface and (area is None or rect.colliderect(area)):
+                self.canvas.blit(surface, rect)
+
+    def hud_layout(self):
+        """
+            Describes what each heads-up display element currently shows, the area it covers and its surface.
+
+            Description:
+                Combatant 1's vitality and score sit on the left, Combatant 2's on the right, and the battle
+                number at the top center. Vitality meters are hidden once vitality runs out.
+
+            Returns:
+                dict: Element names mapped to (shown value, pygame.Rect, pygame.Surface or None) tuples.
+        """
+        tally_surface1 = self.render_hud_text('tally1', self.combatant1.tally, "Combatant 1: {}", COLOR_WHITE)
+        tally_surface2 = self.render_hud_text('tally2', self.combatant2.tally, "Combatant 2: {}", COLOR_WHITE)
+        battle_info_surface = self.render_hud_text('battle', self.currentBattle, "Battle: {}", COLOR_GREEN)
+        return {
+            'vitality1': (self.combatant1.vitality, pygame.Rect(20, DISPLAY_HEIGHT - 20, 100, 10),
+                          self.vitality_meter_surface(self.combatant1.vitality, 100)),
+            'vitality2': (self.combatant2.vitality, pygame.Rect(DISPLAY_WIDTH - 120, DISPLAY_HEIGHT - 20, 100, 10),
+                          self.vitality_meter_surface(self.combatant2.vitality, 100)),
+            'tally1': (self.combatant1.tally, tally_surface1.get_rect(topleft=(10, 10)), tally_surface1),
+            'tally2': (self.combatant2.tally, tally_surface2.get_rect(topright=(DISPLAY_WIDTH - 10, 10)), tally_surface2),
+            'battle': (self.currentBattle, battle_info_surface.get_rect(center=(DISPLAY_WIDTH // 2, 20)),
+                       battle_info_surface),
+        }
+
+    def repaint_area(self, area, hud_state):
+        """
+            Clears an area of the battle field and redraws the grid cells and heads-up display elements inside it.
+
+            Args:
+                area (pygame.Rect): The area of the canvas to repaint.
+                hud_state (dict): The current layout returned by hud_layout().
+        """
+        self.canvas.set_clip(area)
+        self.canvas.fill(COLOR_BLACK, area)
+        for x in range(area.left // REPTILE_DIMENSION, (area.right - 1) // REPTILE_DIMENSION + 1):
+            for y in range(area.top // REPTILE_DIMENSION, (area.bottom - 1) // REPTILE_DIMENSION + 1):
+                self.render_cell((x, y))
+        self.render_hud(hud_state, area)
+        self.canvas.set_clip(None)
+
+    def refresh_battle_area(self):
+        """
+            Repaints only what changed since the last frame and pushes just those areas to the screen.
+
+            Description:
+                Cells marked dirty by movement, nourishment and orbs are repainted, together with the previous and
+                current areas of any heads-up display element whose value or size changed.
+        """
+        dirty_rects = [pygame.Rect(x * REPTILE_DIMENSION, y * REPTILE_DIMENSION, REPTILE_DIMENSION, REPTILE_DIMENSION)
+                       for x, y in self.dirtyCells]
+        hud_state = self.hud_layout()
+        for name, shown in hud_state.items():
+            previous = self.hudState.get(name)
+            if not previous or previous[:2] != shown[:2]:
+                dirty_rects.append(shown[1])
+                if previous:
+                    dirty_rects.append(previous[1])
+        for area in dirty_rects:
+            self.repaint_area(area, hud_state)
+        pygame.display.update(dirty_rects)
+        self.hudState = hud_state
+        self.dirtyCells.clear()
+
     def display(self):
         """
            Handles all rendering and display updates for the game based on the current game state.
 
            Operations:
-           - Clears the screen and redraws game elements when the game is active.
+           - Repaints only the changed cells and heads-up display elements while a battle is in progress,
+             falling back to a full repaint when the battle is first shown.
+           - Clears the screen and redraws game elements for the other game states, but only when
+             the state changed or an interaction was handled since the last repaint.
            - Renders reptiles, nourishment, and vitality meters during active play.
            - Displays game controls and text input fields when in configuration or menu mode.
            - Shows the game's logo and menu options when the game is not in active play or configuration.
            - Transitions to a game over screen layout when the game has ended.
         """
+        scene = 'over' if self.isOver else 'battle' if self.isInPlay else 'input' if self.isAcceptingInput else 'menu'
+        if scene == self.shownScene:
+            if scene == 'battle':
+                self.refresh_battle_area()
+                return
+            if not self.needsRedraw:
+                return
+        self.shownScene = scene
+        self.needsRedraw = False
+
         if not self.isOver:
             self.canvas.fill(COLOR_BLACK)  # Clear the screen for regular game updates
 
@@ -328,28 +571,21 @@ class MatchController:
                 # Render game play elements like reptiles, nourishment, vitality etc.
                 self.render_reptile(self.combatant1)
                 self.render_reptile(self.combatant2)
-                for orb in self.restorativeOrbs:
+                for orb in self.restorativeOrbs.values():
                     orb.render(self.canvas)
-                self.canvas.blit(self.creatureGraphic, (self.nourishment['x'] * REPTILE_DIMENSION, self.nourishment['y'] * REPTILE_DIMENSION))
-                self.render_vitality_meter(20, DISPLAY_HEIGHT - 20, self.combatant1.vitality, 100)
-                self.render_vitality_meter(DISPLAY_WIDTH - 120, DISPLAY_HEIGHT - 20, self.combatant2.vitality, 100)
-                self.display_scores()
-
-                # Display current battle information
-                font_style = pygame.font.Font(None, 36)  # Define font at the start of the method
-                battle_info_text = f"Battle: {self.currentBattle}"
-                battle_info_surface = font_style.render(battle_info_text, True, COLOR_GREEN)
-                battle_info_rectangle = battle_info_surface.get_rect(center=(DISPLAY_WIDTH // 2, 20))
-                self.canvas.blit(battle_info_surface, battle_info_rectangle)
+                nourishment_x, nourishment_y = self.nourishment
+                self.canvas.blit(self.creatureGraphic, (nourishment_x * REPTILE_DIMENSION, nourishment_y * REPTILE_DIMENSION))
+                self.hudState = self.hud_layout()
+                self.render_hud(self.hudState)
+                self.dirtyCells.clear()
 
             elif self.isAcceptingInput:
                 # Display the input prompt and the current text input by the user
-                font_style = pygame.font.Font(None, 36)
-                prompt_surface = font_style.render("Enter number of battles:", True, COLOR_GREEN)
+                prompt_surface = self.render_text(self.font_36, "Enter number of battles:", COLOR_GREEN)
                 prompt_rectangle = prompt_surface.get_rect(center=(DISPLAY_WIDTH // 2, DISPLAY_HEIGHT // 2 - 50))
                 self.canvas.blit(prompt_surface, prompt_rectangle)
 
-                input_surface = font_style.render(self.enteredText, True, COLOR_BLACK, COLOR_GREEN)
+                input_surface = self.font_36.render(self.enteredText, True, COLOR_BLACK, COLOR_GREEN)
                 input_rectangle = input_surface.get_rect(center=(DISPLAY_WIDTH // 2, DISPLAY_HEIGHT // 2))
                 self.canvas.blit(input_surface, input_rectangle)
 
@@ -393,13 +629,20 @@ class MatchController:
     def execute(self):
         """
             Executes the main game loop.
+
+            While a battle is running the loop advances the game at FRAME_RATE. Otherwise nothing changes on its
+            own, so the loop sleeps until an interaction arrives (or IDLE_WAIT passes) instead of spinning.
         """
         while self.isActive:
-            self.manage_interactions()
+            battle_running = self.isInPlay and not self.isPaused and not self.isOver
+            self.manage_interactions(0 if battle_running else IDLE_WAIT)
+            # Checking again, as the interactions may have started or ended the battle
             if self.isInPlay and not self.isPaused and not self.isOver:
                 self.advance_game()
-            self.display()
-            self.timer.tick(FRAME_RATE)
+                self.display()
+                self.timer.tick(FRAME_RATE)
+            else:
+                self.display()
 
     def restart_battle(self):
         """
@@ -416,12 +659,12 @@ class MatchController:
         # Clear the battle scores file
         open("battle_scores.txt", "w").close()
 
-        self.combatant1 = Reptile({'x': 5, 'y': DISPLAY_HEIGHT // REPTILE_DIMENSION // 2}, MOVE_RIGHT, COLOR_YELLOW)
-        self.combatant2 = Reptile({'x': DISPLAY_WIDTH // REPTILE_DIMENSION - 5, 'y': DISPLAY_HEIGHT // REPTILE_DIMENSION // 2}, MOVE_LEFT,
+        self.combatant1 = Reptile((5, GRID_H // 2), MOVE_RIGHT, COLOR_YELLOW)
+        self.combatant2 = Reptile((GRID_W - 5, GRID_H // 2), MOVE_LEFT,
                              COLOR_ORANGE)
         self.nourishment = self.generate_nourishment()
         self.restorativeOrbs.clear()
-        self.lastOrbRegen = time.time()  # Reset orb regeneration timer
+        self.nextOrbRegen = pygame.time.get_ticks() + ORB_RESPAWN_TIME * 1000  # Reset orb regeneration timer
 
     def render_button(self, label, xPos, yPos, isActive=True):
         """
@@ -438,32 +681,11 @@ class MatchController:
         button_tint = COLOR_GRAY if not isActive else COLOR_WHITE
         action_rect = pygame.Rect(xPos, yPos, ACTION_WIDTH, ACTION_HEIGHT)
         pygame.draw.rect(self.canvas, button_tint, action_rect)
-        label_surf = pygame.font.Font(None, 24).render(label, True, COLOR_BLACK)
+        label_surf = self.render_text(self.font_24, label, COLOR_BLACK)
         label_rect = label_surf.get_rect(center=action_rect.center)
         self.canvas.blit(label_surf, label_rect)
         return action_rect
 
-    def display_scores(self):
-        """
-            Displays the current scores of both combatants on the game canvas.
-
-            Description:
-                This method renders the current tally of each combatant in the game. Combatant 1's score is displayed
-                on the top-left corner of the screen, while Combatant 2's score is displayed on the top-right corner.
-                This provides a clear and constant update on the score throughout the game.
-        """
-        score_font = pygame.font.Font(None, 36)  # Font for score display
-        # Combatant 1 tally on the top-left corner
-        tally_text1 = f"Combatant 1: {self.combatant1.tally}"
-        tally_surface1 = score_font.render(tally_text1, True, COLOR_WHITE)
-        self.canvas.blit(tally_surface1, (10, 10))
-
-        # Combatant 2 tally on the top-right corner
-        tally_text2 = f"Combatant 2: {self.combatant2.tally}"
-        tally_surface2 = score_font.render(tally_text2, True, COLOR_WHITE)
-        tally_width = tally_surface2.get_width()
-        self.canvas.blit(tally_surface2, (DISPLAY_WIDTH - tally_width - 10, 10))
-
     def display_battle_over_screen(self):
         """
             Displays the end-of-battle screen, showing the results and providing options to restart or end the battle.
@@ -472,10 +694,9 @@ class MatchController:
         if not self.scoresReady:
             self.canvas.fill(COLOR_BLACK)
 
-            # Load and display the Battle Over image
-            battle_over_img = pygame.image.load('game_over_image.png')  # Ensure the 'battle_over.png' is in the correct directory
-            battle_over_img_rect = battle_over_img.get_rect(center=(DISPLAY_WIDTH // 2, DISPLAY_HEIGHT // 4))
-            self.canvas.blit(battle_over_img, battle_over_img_rect)
+            # Display the Battle Over image
+            battle_over_img_rect = self.battleOverGraphic.get_rect(center=(DISPLAY_WIDTH // 2, DISPLAY_HEIGHT // 4))
+            self.canvas.blit(self.battleOverGraphic, battle_over_img_rect)
 
             # Read tallies from file and calculate total tallies
             with open("battle_scores.txt", "r") as file:
@@ -484,14 +705,13 @@ class MatchController:
             combatant2_total = sum(int(tally.split('-')[1].strip()) for tally in tallies)
             # Determine the champion based on total tallies
             champion_text = "Combatant 1 Triumphs!" if combatant1_total > combatant2_total else "Combatant 2 Triumphs!" if combatant2_total > combatant1_total else "Stalemate Achieved!"
-            battle_font = pygame.font.Font(None, 36)
-            result_surface = battle_font.render(champion_text, True, COLOR_WHITE)
+            result_surface = self.render_text(self.font_36, champion_text, COLOR_WHITE)
             result_rectangle = result_surface.get_rect(center=(DISPLAY_WIDTH // 2, DISPLAY_HEIGHT // 2))
             self.canvas.blit(result_surface, result_rectangle)
 
             # Display the total tallies
             tally_text = f"Combatant 1: {combatant1_total} - Combatant 2: {combatant2_total}"
-            tally_surface = battle_font.render(tally_text, True, COLOR_WHITE)
+            tally_surface = self.font_36.render(tally_text, True, COLOR_WHITE)
             tally_rectangle = tally_surface.get_rect(center=(DISPLAY_WIDTH // 2, DISPLAY_HEIGHT // 2 + 40))
             self.canvas.blit(tally_surface, tally_rectangle)
 
@@ -7,32 +7,8 @@ import sys
 from pygame.locals import *
 from random import randint
 import time
-
-# Configuration Values
-DISPLAY_WIDTH, DISPLAY_HEIGHT = 1200, 900
-FRAME_RATE = 30
-REPTILE_DIMENSION = 20
-ACTION_WIDTH, ACTION_HEIGHT = 100, 50
-ORB_RADIUS = 10
-ORB_RESPAWN_TIME = 20  # in seconds
-
-# Motion Directions
-MOVE_RIGHT = {'x': 1, 'y': 0}
-MOVE_LEFT = {'x': -1, 'y': 0}
-MOVE_UP = {'x': 0, 'y': -1}
-MOVE_DOWN = {'x': 0, 'y': 1}
-
-# Palette
-COLOR_BLACK = (0, 0, 0)
-COLOR_WHITE = (255, 255, 255)
-COLOR_GRAY = (100, 100, 100)
-COLOR_PINK = (255, 192, 203)
-COLOR_YELLOW = (255, 223, 0)
-COLOR_ORANGE = (255, 69, 0)
-COLOR_GREEN = (173, 255, 47)
-COLOR_GOLD = (255, 215, 0)
-
-
+from collections import Counter, deque
+from config import *
 
 
 class Reptile:
@@ -40,63 +16,102 @@ class Reptile:
         Represents a reptile(i.e., cobra snake) in the game which moves across the battle area and interacts with various game elements.
 
         Attributes:
-            segments (list): A list of dictionaries defining the positions of segments that make up the reptile's body.
-            move_direction (dict): The current movement direction of the reptile as a dictionary with 'x' and 'y' keys.
+            segments (deque): A deque of (x, y) tuples defining the positions of segments that make up the reptile's body, head first.
+            occupied (Counter): Number of body segments on each cell, used for constant time body lookups.
+            move_direction (tuple): The current movement direction of the reptile as an (x, y) step.
             tint (tuple): RGB color tuple for the reptile's color.
             vitality (int): The health of the reptile, starts at 100.
             tally (int): The score tally for the reptile, incremented during the game.
+            tile (pygame.Surface): A single segment pre-filled with the reptile's color, blitted for every segment.
+            pending_growth (int): Number of upcoming moves that keep the tail in place, growing the reptile.
 
         Methods:
+            head: The position of the reptile's head.
+            occupies(cell): Checks if any body segment lies on the given (x, y) cell.
             move(): Updates the reptile's position based on its current direction.
-            expand(): Increases the length of the reptile by adding a segment at its tail.
+            expand(): Increases the length of the reptile by one segment on its next move.
             detect_collision(item): Checks if the reptile's head has collided with an item.
             detect_self_impact(): Checks if the reptile has collided with itself.
     """
+    # Fixed attribute slots instead of a per-instance __dict__, for smaller instances and faster attribute access
+    __slots__ = ('segments', 'occupied', 'move_direction', 'tint', 'vitality', 'tally', 'tile', 'pending_growth')
+
     def __init__(self, start_position, move_direction, tint):
         """
          Initializes a new instance of the Reptile class.
-         :param start_position: The starting position of the reptile's head as a dictionary with 'x' and 'y' keys.
-         :type start_position: dict
-         :param move_direction: Initial movement direction of the reptile as a dictionary.
-         :type move_direction: dict
+         :param start_position: The starting position of the reptile's head as an (x, y) tuple.
+         :type start_position: tuple
+         :param move_direction: Initial movement direction of the reptile as an (x, y) step.
+         :type move_direction: tuple
          :param tint: The color of the reptile, given as an RGB tuple.
          :type tint: tuple
         """
         # Initializing a new Reptile instance with a starting position, movement direction, and color.
-        self.segments = [start_position]
+        self.segments = deque([start_position])
+        self.occupied = Counter([start_position])
         self.move_direction = move_direction
         self.tint = tint
         self.vitality = 100
         self.tally = 0
+        self.tile = pygame.Surface((REPTILE_DIMENSION, REPTILE_DIMENSION))
+        self.tile.fill(tint)
+        self.pending_growth = 0
+
+    @property
+    def head(self):
+        """ The position of the reptile's head as an (x, y) tuple. """
+        return self.segments[0]
+
+    def occupies(self, cell):
+        """
+         Checks if any segment of the reptile's body lies on the given cell.
+         :param cell: The (x, y) cell to check.
+         :type cell: tuple
+         :return: True if a body segment is on the cell; otherwise, False.
+        """
+        return cell in self.occupied
 
     def move(self):
         """
          Updates the reptile's head position based on its current direction,
          adding a new segment at the front and removing the last segment, simulating movement.
+         While the reptile is growing the last segment is kept, lengthening the body by one.
+         :return: The positions that changed: the new head and, unless the reptile grew, the removed tail segment.
         """
         # Updating the reptile's position by calculating new head position and adjusting the body.
-        new_head = {
-            'x': (self.segments[0]['x'] + self.move_direction['x']) % (DISPLAY_WIDTH // REPTILE_DIMENSION),
-            'y': (self.segments[0]['y'] + self.move_direction['y']) % (DISPLAY_HEIGHT // REPTILE_DIMENSION),
-        }
-        self.segments.insert(0, new_head)
+        grid_w, grid_h = GRID_W, GRID_H
+        segments = self.segments
+        occupied = self.occupied
+        head_x, head_y = segments[0]
+        step_x, step_y = self.move_direction
+        new_head = ((head_x + step_x) % grid_w, (head_y + step_y) % grid_h)
+        segments.appendleft(new_head)
+        occupied[new_head] += 1
+        if self.pending_growth:
+            # Keeping the tail in place so the body grows by one segment.
+            self.pending_growth -= 1
+            return new_head,
         # Removing the last segment of the body.
-        self.segments.pop()
+        tail = segments.pop()
+        occupied[tail] -= 1
+        if not occupied[tail]:
+            del occupied[tail]
+        return new_head, tail
 
     def expand(self):
-        """ Adds a new segment at the end of the reptile's body, increasing its length by one segment. """
-        # Adding a new segment at the tail of the reptile.
-        self.segments.append(self.segments[-1])
+        """ Increases the length of the reptile by one segment, which appears at the tail on the next move. """
+        # Letting the next move keep the tail instead of stacking a duplicate segment on it.
+        self.pending_growth += 1
 
     def detect_collision(self, item):
         """
           Determines if the reptile's head is at the same position as a given item.
-         :param item: An item with 'x' and 'y' coordinates.
-         :type item: dict
+         :param item: The (x, y) position of an item.
+         :type item: tuple
          :return: True if there's a collision; otherwise, False.
         """
         # Checking if the reptile's head is at the same coordinates as another game item
-        return self.segments[0]['x'] == item['x'] and self.segments[0]['y'] == item['y']
+        return self.segments[0] == item
 
     def detect_self_impact(self):
         """
@@ -104,4 +119,4 @@ class Reptile:
          :return: True if the head collides with any other body segment; otherwise, False.
         """
         # Checking if the reptile's head has collided with any other part of its body.
-        return self.segments[0] in self.segments[1:]
+        return self.occupied[self.segments[0]] > 1
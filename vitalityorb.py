@@ -7,37 +7,21 @@ import sys
 from pygame.locals import *
 from random import randint
 import time
+from config import *
 
-# Configuration Values
-DISPLAY_WIDTH, DISPLAY_HEIGHT = 1200, 900  # Screen dimensions in pixels
-FRAME_RATE = 30                            # FPS
-REPTILE_DIMENSION = 20                     # Grid cell size
-ACTION_WIDTH, ACTION_HEIGHT = 100, 50      # Action button dimensions
-ORB_RADIUS = 10                            # Radius of the vitality orb
-ORB_RESPAWN_TIME = 20                      # Time for orb to respawn
-
-# Motion Directions
-MOVE_RIGHT = {'x': 1, 'y': 0}
-MOVE_LEFT = {'x': -1, 'y': 0}
-MOVE_UP = {'x': 0, 'y': -1}
-MOVE_DOWN = {'x': 0, 'y': 1}
-
-# Palette
-COLOR_BLACK = (0, 0, 0)
-COLOR_WHITE = (255, 255, 255)
-COLOR_GRAY = (100, 100, 100)
-COLOR_PINK = (255, 192, 203)
-COLOR_YELLOW = (255, 223, 0)
-COLOR_ORANGE = (255, 69, 0)
-COLOR_GREEN = (173, 255, 47)
-COLOR_GOLD = (255, 215, 0)
 
 class VitalityOrb:
     """
     Represents a vitality orb in the game. The orb spawns at random coordinates
     within the grid and can be rendered on the game canvas.
+
+    Every orb looks the same, so the circle is drawn once onto a sprite shared
+    by the class and blitted from there.
     """
 
+    __slots__ = ('coordinates',)  # No per-instance __dict__
+    sprite = None  # Shared pre-rendered orb, created on first use
+
     def __init__(self):
         self.coordinates = self.regenerate()
 
@@ -46,22 +30,34 @@ class VitalityOrb:
         Randomly generates new coordinates for the vitality orb within the grid.
 
         Returns:
-            dict: A dictionary containing the 'x' and 'y' coordinates of the orb.
+            tuple: The (x, y) coordinates of the orb.
+        """
+        coord_x = randint(0, GRID_W - 1)
+        coord_y = randint(0, GRID_H - 1)
+        return coord_x, coord_y
+
+    @classmethod
+    def get_sprite(cls):
+        """
+        Returns the sprite shared by all vitality orbs, drawing it on first use.
+
+        Returns:
+            pygame.Surface: A grid cell sized surface with the orb circle on a transparent background.
         """
-        coord_x = randint(0, DISPLAY_WIDTH // REPTILE_DIMENSION - 1)
-        coord_y = randint(0, DISPLAY_HEIGHT // REPTILE_DIMENSION - 1)
-        return {'x': coord_x, 'y': coord_y}
+        if cls.sprite is None:
+            sprite = pygame.Surface((REPTILE_DIMENSION, REPTILE_DIMENSION), pygame.SRCALPHA)
+            pygame.draw.circle(
+                sprite,
+                COLOR_PINK,
+                (REPTILE_DIMENSION // 2, REPTILE_DIMENSION // 2),  # Center of the grid cell
+                ORB_RADIUS,  # Radius of the orb
+            )
+            cls.sprite = sprite
+        return cls.sprite
 
     def render(self, canvas):
         """
         Renders the vitality orb as a circle on the given canvas.
         """
-        pygame.draw.circle(
-            canvas,
-            COLOR_PINK,
-            (
-                self.coordinates['x'] * REPTILE_DIMENSION + REPTILE_DIMENSION // 2,  # Center X position
-                self.coordinates['y'] * REPTILE_DIMENSION + REPTILE_DIMENSION // 2   # Center Y position
-            ),
-            ORB_RADIUS,  # Radius of the orb
-        )
+        coord_x, coord_y = self.coordinates
+        canvas.blit(self.get_sprite(), (coord_x * REPTILE_DIMENSION, coord_y * REPTILE_DIMENSION))